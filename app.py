@@ -2,18 +2,19 @@ import streamlit as st
 import os
 from PIL import Image
 from io import BytesIO
-from phi.agent import Agent
-from phi.model.google import Gemini
-from phi.tools.tavily import TavilyTools
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, gettempdir
+from pathlib import Path
 import datetime
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_JUSTIFY
-import base64
+import shutil
+import time
+import gc
+import threading
+import hashlib
+import gzip
+import json
+import importlib
+from concurrent.futures import ThreadPoolExecutor, wait
+from html import escape as html_escape
 
 # API Keys
 TAVILY_API_KEY = os.environ.get("TAVILY_API_KEY")
@@ -24,6 +25,49 @@ if not TAVILY_API_KEY or not GOOGLE_API_KEY:
     st.stop()
 
 MAX_IMAGE_WIDTH = 400
+UPLOAD_CHUNK_SIZE = 1 << 20  # Copy uploads to disk in 1 MB chunks
+UPLOAD_TEMP_PREFIX = "scan_analyzer_"
+MIN_SCAN_BYTES = 1024
+MAX_SCAN_BYTES = 50 * 1024 * 1024
+STALE_UPLOAD_SECONDS = 3600
+PDF_FILENAME_TEMPLATE = "Medical_Analysis_Report_{:%Y%m%d_%H%M%S}.pdf"
+REPORT_DATE_FORMAT = "%B %d, %Y at %I:%M %p"
+GC_EVERY_N_RERUNS = 20
+# Strips markdown emphasis and escapes ReportLab markup characters in one pass over the text
+PDF_TEXT_TRANSLATION = str.maketrans({'*': None, '&': '&amp;', '<': '&lt;', '>': '&gt;'})
+PREWARM_MODULES = ("phi.agent", "phi.model.google", "phi.tools.tavily")
+GEMINI_MODEL_ID = "gemini-2.0-flash-exp"
+ANALYSIS_MAX_WORKERS = 4  # Process-wide cap on in-flight Gemini calls; each call builds its own agent
+ANALYSIS_POLL_SECONDS = 0.3
+ANALYSIS_CACHE_TTL = datetime.timedelta(days=7)
+ANALYSIS_CACHE_MAX_ENTRIES = 500
+ANALYSIS_CACHE_TEMP_GRACE_SECONDS = 60  # Leave temp files of in-flight atomic writes alone
+ANALYSIS_CACHE_DIR = os.environ.get(
+    "ANALYSIS_CACHE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "analysis")
+)
+
+# Option lists for the upload widget and the patient assessment form
+UPLOAD_FILE_TYPES = ("jpg", "jpeg", "png", "pdf")
+GENDER_OPTIONS = ("Male", "Female", "Other")
+COMMON_CONDITIONS = (
+    "Diabetes", "High Blood Pressure", "Heart Disease", "Asthma",
+    "Arthritis", "Thyroid Issues", "Kidney Problems", "Liver Problems", "None of the above",
+)
+EXERCISE_FREQUENCIES = ("Never", "1-2 times/week", "3-4 times/week", "5+ times/week")
+STRESS_LEVELS = ("Very Low", "Low", "Moderate", "High", "Very High")
+SMOKING_OPTIONS = ("Never", "Former", "Current")
+ALCOHOL_OPTIONS = ("Never", "Occasional", "Regular")
+DIET_TYPES = ("Regular/Mixed", "Vegetarian", "Vegan", "Keto", "Mediterranean", "Low-carb", "Other")
+PAIN_LEVELS = tuple(range(11))
+COMMON_SYMPTOMS = (
+    "Fatigue", "Headaches", "Chest Pain", "Shortness of Breath", "Dizziness",
+    "Nausea", "Back Pain", "Joint Pain", "Sleep Problems", "Appetite Changes",
+    "Weight Changes", "Mood Changes", "None of the above",
+)
+
+# Static assets: page CSS and the disclaimer copy shared by the page footer and the PDF report
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
 
 # Enhanced system prompt for medical analysis
 SYSTEM_PROMPT = """You are a specialized medical AI assistant designed to analyze medical scan reports and provide comprehensive health assessments. Your role is to:
@@ -82,14 +126,19 @@ Provide your response in plain text format without any markdown headers or secti
 Use clear, compassionate language that reduces anxiety while being informative.
 """
 
-def resize_image_for_display(image_file):
-    """Resize image for display only, returns bytes."""
+@st.cache_data(show_spinner=False, max_entries=32)
+def resize_image_for_display(file_id, _image_file):
+    """Resize image for display only, returns bytes. Memoized per upload, so the file is only read on a miss."""
     try:
-        img = Image.open(image_file)
-        image_file.seek(0)  # Reset file pointer
+        _image_file.seek(0)
+        img = Image.open(_image_file)
         aspect_ratio = img.height / img.width
         new_height = int(MAX_IMAGE_WIDTH * aspect_ratio)
-        img = img.resize((MAX_IMAGE_WIDTH, new_height), Image.Resampling.LANCZOS)
+        # Let libjpeg downscale during decode (no-op for other formats), then finish with LANCZOS
+        img.draft("RGB", (MAX_IMAGE_WIDTH, new_height))
+        # Image.reduce() rejects 16-bit modes, so those scans are resized with LANCZOS alone
+        reducing_gap = None if img.mode.startswith("I;16") else 2.0
+        img.thumbnail((MAX_IMAGE_WIDTH, new_height), Image.Resampling.LANCZOS, reducing_gap=reducing_gap)
         buf = BytesIO()
         img.save(buf, format="PNG")
         return buf.getvalue()
@@ -97,29 +146,102 @@ def resize_image_for_display(image_file):
         st.error(f"Error resizing image: {e}")
         return None
 
-@st.cache_resource
-def get_agent():
-    """Initialize and cache the AI agent."""
+@st.cache_data(show_spinner=False)
+def load_static_text(filename):
+    """Read a copy file from the static directory once per process."""
+    with open(os.path.join(STATIC_DIR, filename), encoding="utf-8") as f:
+        return f.read().strip()
+
+def prewarm_resources():
+    """Import the lazily loaded libraries and warm PIL codecs and ReportLab font metrics."""
     try:
-        return Agent(
-            model=Gemini(id="gemini-2.0-flash-exp", api_key=GOOGLE_API_KEY),
-            system_prompt=SYSTEM_PROMPT,
-            instructions=INSTRUCTIONS,
-            tools=[TavilyTools(api_key=TAVILY_API_KEY)],
-            markdown=True,
-        )
-    except Exception as e:
-        st.error(f"Error initializing agent: {e}")
-        return None
+        for module_name in PREWARM_MODULES:
+            importlib.import_module(module_name)
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.styles import getSampleStyleSheet
+        from reportlab.platypus import SimpleDocTemplate, Paragraph
+        
+        Image.init()
+        doc = SimpleDocTemplate(BytesIO(), pagesize=A4)
+        doc.build([Paragraph("", getSampleStyleSheet()['Normal'])])
+    except Exception:
+        pass
+
+@st.cache_resource
+def start_prewarm():
+    """Start the prewarm work once per process on a background thread."""
+    thread = threading.Thread(target=prewarm_resources, daemon=True)
+    thread.start()
+    return thread
+
+@st.cache_resource
+def get_search_tools():
+    """Initialize and cache the Tavily search toolkit."""
+    from phi.tools.tavily import TavilyTools
+    
+    return TavilyTools(api_key=TAVILY_API_KEY)
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def cached_web_search(query, max_results):
+    """Run a Tavily web search, memoized for a day across reruns and sessions."""
+    return get_search_tools().web_search_using_tavily(query, max_results)
+
+def web_search_using_tavily(query: str, max_results: int = 5) -> str:
+    """Use this function to search the web for a given query.
+    This function uses the Tavily API to provide realtime online information about the query.
+
+    Args:
+        query (str): Query to search for.
+        max_results (int): Maximum number of results to return. Defaults to 5.
+
+    Returns:
+        str: JSON string of results related to the query.
+    """
+    return cached_web_search(query, max_results)
+
+def create_agent():
+    """Build a fresh AI agent for a single analysis run."""
+    from phi.agent import Agent
+    from phi.model.google import Gemini
+    
+    return Agent(
+        model=Gemini(id=GEMINI_MODEL_ID, api_key=GOOGLE_API_KEY),
+        system_prompt=SYSTEM_PROMPT,
+        instructions=INSTRUCTIONS,
+        tools=[web_search_using_tavily],
+        markdown=True,
+    )
+
+def run_analysis(prompt, image_path):
+    """Run one model call on its own agent; a phi Agent keeps per-run state, so instances are never shared."""
+    return create_agent().run(prompt, images=[image_path])
 
 def collect_patient_information():
     """Collect patient information with an engaging, step-by-step approach."""
     
     # Initialize session state for form progress
-    if 'form_step' not in st.session_state:
-        st.session_state.form_step = 1
-    if 'patient_data' not in st.session_state:
-        st.session_state.patient_data = {}
+    st.session_state.setdefault('form_step', 1)
+    st.session_state.setdefault('patient_data', {})
+    
+    render_assessment_step()
+    
+    # Return data only if form is complete
+    if st.session_state.form_step == 5:
+        return st.session_state.patient_data
+    else:
+        return None
+
+def go_to_step(step, fields=()):
+    """Button callback: save the named widget values into patient_data and move to the given step.
+    
+    Callbacks run before the next rerun, whether that rerun covers the fragment or the whole app.
+    """
+    st.session_state.patient_data.update({field: st.session_state[field] for field in fields})
+    st.session_state.form_step = step
+
+@st.fragment
+def render_assessment_step():
+    """Render the current form step; widget changes and step navigation rerun only this fragment."""
     
     # Progress bar
     progress_value = (st.session_state.form_step - 1) / 4
@@ -132,18 +254,13 @@ def collect_patient_information():
         
         col1, col2 = st.columns(2)
         with col1:
-            age = st.slider("Your Age", 1, 120, 30)
-            height = st.number_input("Height (cm)", 100, 250, 170)
+            st.slider("Your Age", 1, 120, 30, key="age")
+            st.number_input("Height (cm)", 100, 250, 170, key="height")
         with col2:
-            gender = st.selectbox("Gender", ["Male", "Female", "Other"])
-            weight = st.number_input("Weight (kg)", 30, 300, 70)
+            st.selectbox("Gender", GENDER_OPTIONS, key="gender")
+            st.number_input("Weight (kg)", 30, 300, 70, key="weight")
         
-        if st.button("Next →", key="step1_next"):
-            st.session_state.patient_data.update({
-                'age': age, 'gender': gender, 'height': height, 'weight': weight
-            })
-            st.session_state.form_step = 2
-            st.rerun()
+        st.button("Next →", key="step1_next", on_click=go_to_step, args=(2, ('age', 'gender', 'height', 'weight')))
     
     # Step 2: Health Background (Simplified)
     elif st.session_state.form_step == 2:
@@ -151,22 +268,21 @@ def collect_patient_information():
         
         # Quick checkboxes for common conditions
         st.markdown("**Do you have any of these conditions?** (Select all that apply)")
-        conditions = st.multiselect(
+        st.multiselect(
             "",
-            ["Diabetes", "High Blood Pressure", "Heart Disease", "Asthma", 
-             "Arthritis", "Thyroid Issues", "Kidney Problems", "Liver Problems", "None of the above"],
+            COMMON_CONDITIONS,
             key="conditions"
         )
         
         # Medications
-        medications = st.text_input(
+        st.text_input(
             "Current Medications (if any)",
             placeholder="e.g., Metformin, Lisinopril, Vitamin D...",
             key="medications"
         )
         
         # Allergies
-        allergies = st.text_input(
+        st.text_input(
             "Known Allergies",
             placeholder="e.g., Penicillin, Peanuts, Shellfish...",
             key="allergies"
@@ -174,16 +290,9 @@ def collect_patient_information():
         
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("← Previous", key="step2_prev"):
-                st.session_state.form_step = 1
-                st.rerun()
+            st.button("← Previous", key="step2_prev", on_click=go_to_step, args=(1,))
         with col2:
-            if st.button("Next →", key="step2_next"):
-                st.session_state.patient_data.update({
-                    'conditions': conditions, 'medications': medications, 'allergies': allergies
-                })
-                st.session_state.form_step = 3
-                st.rerun()
+            st.button("Next →", key="step2_next", on_click=go_to_step, args=(3, ('conditions', 'medications', 'allergies')))
     
     # Step 3: Lifestyle (Visual and Interactive)
     elif st.session_state.form_step == 3:
@@ -193,109 +302,173 @@ def collect_patient_information():
         
         with col1:
             # Visual sliders for lifestyle factors
-            exercise_freq = st.select_slider(
+            st.select_slider(
                 "Exercise Frequency",
-                options=["Never", "1-2 times/week", "3-4 times/week", "5+ times/week"],
-                value="1-2 times/week"
+                options=EXERCISE_FREQUENCIES,
+                value="1-2 times/week",
+                key="exercise_freq"
             )
             
-            sleep_hours = st.slider("Hours of Sleep per Night", 3, 12, 7)
+            st.slider("Hours of Sleep per Night", 3, 12, 7, key="sleep_hours")
             
-            stress_level = st.select_slider(
+            st.select_slider(
                 "Stress Level",
-                options=["Very Low", "Low", "Moderate", "High", "Very High"],
-                value="Moderate"
+                options=STRESS_LEVELS,
+                value="Moderate",
+                key="stress_level"
             )
         
         with col2:
             # Quick lifestyle choices
-            smoking = st.radio("Smoking Status", ["Never", "Former", "Current"], horizontal=True)
-            alcohol = st.radio("Alcohol Consumption", ["Never", "Occasional", "Regular"], horizontal=True)
+            st.radio("Smoking Status", SMOKING_OPTIONS, horizontal=True, key="smoking")
+            st.radio("Alcohol Consumption", ALCOHOL_OPTIONS, horizontal=True, key="alcohol")
             
             # Diet type
-            diet_type = st.selectbox(
+            st.selectbox(
                 "Diet Type",
-                ["Regular/Mixed", "Vegetarian", "Vegan", "Keto", "Mediterranean", "Low-carb", "Other"]
+                DIET_TYPES,
+                key="diet_type"
             )
         
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("← Previous", key="step3_prev"):
-                st.session_state.form_step = 2
-                st.rerun()
+            st.button("← Previous", key="step3_prev", on_click=go_to_step, args=(2,))
         with col2:
-            if st.button("Next →", key="step3_next"):
-                st.session_state.patient_data.update({
-                    'exercise_freq': exercise_freq, 'sleep_hours': sleep_hours,
-                    'stress_level': stress_level, 'smoking': smoking,
-                    'alcohol': alcohol, 'diet_type': diet_type
-                })
-                st.session_state.form_step = 4
-                st.rerun()
+            st.button("Next →", key="step3_next", on_click=go_to_step, args=(4, (
+                'exercise_freq', 'sleep_hours', 'stress_level', 'smoking', 'alcohol', 'diet_type'
+            )))
     
     # Step 4: Current Concerns (Final Step)
     elif st.session_state.form_step == 4:
         st.subheader("🎯 Current Concerns")
         
         # Pain assessment with visual
-        pain_level = st.select_slider(
+        st.select_slider(
             "Current Pain Level",
-            options=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10],
+            options=PAIN_LEVELS,
             value=0,
-            format_func=lambda x: f"{x}/10 {'😊' if x <= 3 else '😐' if x <= 6 else '😟'}"
+            format_func=lambda x: f"{x}/10 {'😊' if x <= 3 else '😐' if x <= 6 else '😟'}",
+            key="pain_level"
         )
         
         # Symptoms checkboxes
         st.markdown("**Current Symptoms** (Select all that apply)")
-        symptoms = st.multiselect(
+        st.multiselect(
             "",
-            ["Fatigue", "Headaches", "Chest Pain", "Shortness of Breath", "Dizziness",
-             "Nausea", "Back Pain", "Joint Pain", "Sleep Problems", "Appetite Changes",
-             "Weight Changes", "Mood Changes", "None of the above"],
+            COMMON_SYMPTOMS,
             key="symptoms"
         )
         
         # Additional concerns
-        additional_concerns = st.text_area(
+        st.text_area(
             "Any additional concerns or symptoms?",
             placeholder="Describe any other symptoms, concerns, or recent changes...",
-            height=80
+            height=80,
+            key="additional_concerns"
         )
         
         col1, col2 = st.columns(2)
         with col1:
-            if st.button("← Previous", key="step4_prev"):
-                st.session_state.form_step = 3
-                st.rerun()
+            st.button("← Previous", key="step4_prev", on_click=go_to_step, args=(3,))
         with col2:
-            if st.button("Complete Assessment ✓", key="step4_complete", type="primary"):
-                st.session_state.patient_data.update({
-                    'pain_level': pain_level, 'symptoms': symptoms,
-                    'additional_concerns': additional_concerns
-                })
-                st.session_state.form_step = 5  # Completed
-                st.rerun()
+            if st.button("Complete Assessment ✓", key="step4_complete", type="primary", on_click=go_to_step,
+                         args=(5, ('pain_level', 'symptoms', 'additional_concerns'))):
+                st.rerun()  # Full rerun so the page picks up the completed assessment
+
+@st.cache_resource
+def get_analysis_executor():
+    """Create the process-wide worker pool that runs model calls for every session."""
+    return ThreadPoolExecutor(max_workers=ANALYSIS_MAX_WORKERS, thread_name_prefix="analysis")
+
+def analysis_cache_key(image_path, prompt):
+    """Hash the scan bytes together with everything that shapes the model's answer."""
+    digest = hashlib.sha256()
+    with open(image_path, "rb") as f:
+        for chunk in iter(lambda: f.read(UPLOAD_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    for part in (prompt, SYSTEM_PROMPT, INSTRUCTIONS, GEMINI_MODEL_ID):
+        digest.update(b"\0")
+        digest.update(part.encode("utf-8"))
+    return digest.hexdigest()
+
+def load_cached_analysis(cache_key):
+    """Return a previously stored analysis for this key, or None on a miss or expired entry."""
+    cache_path = os.path.join(ANALYSIS_CACHE_DIR, f"{cache_key}.json")
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            entry = json.load(f)
+        created = datetime.datetime.fromisoformat(entry['created'])
+    except (OSError, ValueError, KeyError):
+        return None
     
-    # Return data only if form is complete
-    if st.session_state.form_step == 5:
-        return st.session_state.patient_data
-    else:
+    if datetime.datetime.now() - created > ANALYSIS_CACHE_TTL:
+        Path(cache_path).unlink(missing_ok=True)
         return None
+    return entry['content']
+
+def store_cached_analysis(cache_key, content):
+    """Write an analysis to the on-disk cache atomically; failures only cost a future miss."""
+    try:
+        os.makedirs(ANALYSIS_CACHE_DIR, exist_ok=True)
+        with NamedTemporaryFile("w", encoding="utf-8", dir=ANALYSIS_CACHE_DIR, suffix=".tmp", delete=False) as temp_file:
+            json.dump({'content': content, 'created': datetime.datetime.now().isoformat()}, temp_file)
+        os.replace(temp_file.name, os.path.join(ANALYSIS_CACHE_DIR, f"{cache_key}.json"))
+    except OSError:
+        pass
+    prune_analysis_cache()
+
+def store_finished_analysis(cache_key, future):
+    """Done-callback for a model call: cache its analysis unless the call failed or came back empty."""
+    if future.cancelled() or future.exception() is not None:
+        return
+    content = future.result().content
+    if content:
+        store_cached_analysis(cache_key, content)
+
+def prune_analysis_cache():
+    """Delete expired analyses and orphaned temp files, then evict the oldest entries beyond the cap."""
+    now = time.time()
+    entries = []
+    for cache_path in Path(ANALYSIS_CACHE_DIR).glob("*"):
+        try:
+            age = now - cache_path.stat().st_mtime
+            if cache_path.suffix == ".tmp" and age > ANALYSIS_CACHE_TEMP_GRACE_SECONDS:
+                cache_path.unlink(missing_ok=True)
+            elif cache_path.suffix == ".json" and age > ANALYSIS_CACHE_TTL.total_seconds():
+                cache_path.unlink(missing_ok=True)
+            elif cache_path.suffix == ".json":
+                entries.append((age, cache_path))
+        except OSError:
+            pass
+    
+    # Entries are written once, so the oldest modification time is the oldest analysis
+    entries.sort()
+    for _, cache_path in entries[ANALYSIS_CACHE_MAX_ENTRIES:]:
+        try:
+            cache_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+@st.cache_resource
+def cleanup_analysis_cache():
+    """Prune the on-disk analysis cache once at startup."""
+    prune_analysis_cache()
+
+def summarize_patient_profile(patient_info):
+    """Derive the BMI and display strings shared by the summary, the prompt and the PDF."""
+    bmi = patient_info['weight'] / ((patient_info['height'] / 100) ** 2)
+    return {
+        'bmi': bmi,
+        'bmi_category': "Underweight" if bmi < 18.5 else "Normal" if bmi < 25 else "Overweight" if bmi < 30 else "Obese",
+        'conditions': ", ".join(patient_info['conditions']) if patient_info.get('conditions') else "None reported",
+        'symptoms': ", ".join(patient_info['symptoms']) if patient_info.get('symptoms') else "None reported",
+    }
 
 def analyze_medical_scan(image_path, patient_info):
     """Analyze the medical scan using AI agent with patient information."""
-    agent = get_agent()
-    if agent is None:
-        return None
-    
     try:
-        with st.spinner("🔬 Analyzing medical scan and creating personalized health plan..."):
-            # Calculate BMI
-            bmi = patient_info['weight'] / ((patient_info['height'] / 100) ** 2)
-            
-            # Format patient information nicely
-            conditions_str = ", ".join(patient_info.get('conditions', [])) if patient_info.get('conditions') else "None reported"
-            symptoms_str = ", ".join(patient_info.get('symptoms', [])) if patient_info.get('symptoms') else "None reported"
+        with st.status("🔬 Analyzing medical scan and creating personalized health plan...", expanded=True) as status:
+            profile = summarize_patient_profile(patient_info)
             
             # Create comprehensive prompt with patient information
             prompt = f"""
@@ -306,8 +479,8 @@ def analyze_medical_scan(image_path, patient_info):
             - Gender: {patient_info['gender']}
             - Height: {patient_info['height']} cm
             - Weight: {patient_info['weight']} kg
-            - BMI: {bmi:.1f}
-            - Existing Conditions: {conditions_str}
+            - BMI: {profile['bmi']:.1f}
+            - Existing Conditions: {profile['conditions']}
             - Current Medications: {patient_info.get('medications', 'None reported')}
             - Known Allergies: {patient_info.get('allergies', 'None reported')}
             - Exercise Frequency: {patient_info.get('exercise_freq', 'Not specified')}
@@ -317,7 +490,7 @@ def analyze_medical_scan(image_path, patient_info):
             - Alcohol Consumption: {patient_info.get('alcohol', 'Not specified')}
             - Diet Type: {patient_info.get('diet_type', 'Not specified')}
             - Current Pain Level: {patient_info.get('pain_level', 0)}/10
-            - Current Symptoms: {symptoms_str}
+            - Current Symptoms: {profile['symptoms']}
             - Additional Concerns: {patient_info.get('additional_concerns', 'None reported')}
 
             COMPREHENSIVE ANALYSIS REQUIREMENTS:
@@ -337,132 +510,85 @@ def analyze_medical_scan(image_path, patient_info):
             Be encouraging and supportive while being medically accurate.
             """
             
-            response = agent.run(prompt, images=[image_path])
+            # Identical scan + prompt combinations are served from the session, then the on-disk cache
+            cache_key = analysis_cache_key(image_path, prompt)
+            # Session entries are gzip-compressed text; analyses shrink several-fold per session
+            session_cache = st.session_state.setdefault('analysis_cache', {})
+            if cache_key in session_cache:
+                status.update(label="✅ Analysis loaded from cache", expanded=False)
+                return gzip.decompress(session_cache[cache_key]).decode("utf-8")
+            cached_analysis = load_cached_analysis(cache_key)
+            if cached_analysis:
+                status.update(label="✅ Analysis loaded from cache", expanded=False)
+                session_cache[cache_key] = gzip.compress(cached_analysis.encode("utf-8"), compresslevel=1)
+                return cached_analysis
+            
+            # Run the model call on the shared worker pool, which caps concurrent Gemini requests
+            future = get_analysis_executor().submit(run_analysis, prompt, image_path)
+            # Store from the worker, so a rerun that interrupts the polling below still fills the cache
+            future.add_done_callback(lambda done: store_finished_analysis(cache_key, done))
+            
+            # Poll the worker so the progress bar keeps moving while the model call is in flight
+            progress_bar = st.progress(0)
+            progress = 0
+            while not wait([future], timeout=ANALYSIS_POLL_SECONDS).done:
+                progress = min(progress + 1, 95)
+                progress_bar.progress(progress)
+            progress_bar.progress(100)
+            response = future.result()
+            status.update(label="✅ Analysis complete")
+            if response.content:
+                session_cache[cache_key] = gzip.compress(response.content.encode("utf-8"), compresslevel=1)
             return response.content
             
     except Exception as e:
         st.error(f"Error during analysis: {e}")
         return None
 
-def create_pdf_report(patient_info, analysis_result):
-    """Create a formal PDF report with proper error handling."""
-    try:
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
-        
-        # Get styles
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        title_style = ParagraphStyle(
+@st.cache_resource
+def get_pdf_styles():
+    """Build the report's paragraph and table styles once per process."""
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.platypus import TableStyle
+    
+    styles = getSampleStyleSheet()
+    return {
+        'title': ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
             fontSize=18,
             spaceAfter=30,
             alignment=TA_CENTER,
             textColor=colors.HexColor('#2E5E8A')
-        )
-        
-        heading_style = ParagraphStyle(
+        ),
+        'heading': ParagraphStyle(
             'CustomHeading',
             parent=styles['Heading2'],
             fontSize=14,
             spaceAfter=12,
             spaceBefore=12,
             textColor=colors.HexColor('#2E5E8A')
-        )
-        
-        body_style = ParagraphStyle(
+        ),
+        'body': ParagraphStyle(
             'CustomBody',
             parent=styles['Normal'],
             fontSize=11,
             spaceAfter=6,
             alignment=TA_JUSTIFY,
             leading=14
-        )
-        
-        # Build the PDF content
-        story = []
-        
-        # Title
-        story.append(Paragraph("COMPREHENSIVE MEDICAL SCAN ANALYSIS REPORT", title_style))
-        story.append(Spacer(1, 12))
-        
-        # Report Information
-        current_date = datetime.datetime.now().strftime("%B %d, %Y at %I:%M %p")
-        story.append(Paragraph(f"<b>Report Generated:</b> {current_date}", body_style))
-        story.append(Spacer(1, 20))
-        
-        # Patient Information Table
-        bmi = patient_info['weight'] / ((patient_info['height'] / 100) ** 2)
-        bmi_category = "Underweight" if bmi < 18.5 else "Normal" if bmi < 25 else "Overweight" if bmi < 30 else "Obese"
-        
-        # Format conditions and symptoms
-        conditions_str = ", ".join(patient_info.get('conditions', [])) if patient_info.get('conditions') else "None reported"
-        symptoms_str = ", ".join(patient_info.get('symptoms', [])) if patient_info.get('symptoms') else "None reported"
-        
-        patient_data = [
-            ['Patient Demographics', ''],
-            ['Age', f"{patient_info['age']} years"],
-            ['Gender', patient_info['gender']],
-            ['Height', f"{patient_info['height']} cm"],
-            ['Weight', f"{patient_info['weight']} kg"],
-            ['BMI', f"{bmi:.1f} ({bmi_category})"],
-            ['', ''],
-            ['Health Information', ''],
-            ['Existing Conditions', conditions_str],
-            ['Current Medications', patient_info.get('medications', 'None reported')],
-            ['Known Allergies', patient_info.get('allergies', 'None reported')],
-            ['Exercise Frequency', patient_info.get('exercise_freq', 'Not specified')],
-            ['Sleep Hours per Night', f"{patient_info.get('sleep_hours', 'Not specified')}"],
-            ['Stress Level', patient_info.get('stress_level', 'Not specified')],
-            ['Smoking Status', patient_info.get('smoking', 'Not specified')],
-            ['Alcohol Consumption', patient_info.get('alcohol', 'Not specified')],
-            ['Diet Type', patient_info.get('diet_type', 'Not specified')],
-            ['Current Pain Level', f"{patient_info.get('pain_level', 0)}/10"],
-            ['Current Symptoms', symptoms_str]
-        ]
-        
-        table = Table(patient_data, colWidths=[2.5*inch, 3.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8F4FD')),
-            ('BACKGROUND', (0, 7), (-1, 7), colors.HexColor('#E8F4FD')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2E5E8A')),
-            ('TEXTCOLOR', (0, 7), (-1, 7), colors.HexColor('#2E5E8A')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 7), (-1, 7), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-        ]))
-        
-        story.append(table)
-        story.append(Spacer(1, 20))
-        
-        # Additional Concerns Section
-        if patient_info.get('additional_concerns', '').strip():
-            story.append(Paragraph("Additional Concerns", heading_style))
-            story.append(Paragraph(patient_info['additional_concerns'], body_style))
-            story.append(Spacer(1, 12))
-        
-        # Analysis Results
-        story.append(Paragraph("COMPREHENSIVE ANALYSIS & RECOMMENDATIONS", heading_style))
-        story.append(Spacer(1, 12))
-        
-        # Split analysis into paragraphs for better formatting
-        analysis_paragraphs = analysis_result.split('\n\n')
-        for paragraph in analysis_paragraphs:
-            if paragraph.strip():
-                # Clean up any potential markup
-                clean_paragraph = paragraph.strip().replace('**', '').replace('*', '')
-                story.append(Paragraph(clean_paragraph, body_style))
-                story.append(Spacer(1, 8))
-        
-        # Disclaimer
-        story.append(Spacer(1, 20))
-        disclaimer_style = ParagraphStyle(
+        ),
+        # Analysis paragraphs carry their own trailing gap instead of a Spacer flowable each
+        'analysis': ParagraphStyle(
+            'AnalysisBody',
+            parent=styles['Normal'],
+            fontSize=11,
+            spaceAfter=14,
+            alignment=TA_JUSTIFY,
+            leading=14
+        ),
+        'disclaimer': ParagraphStyle(
             'Disclaimer',
             parent=styles['Normal'],
             fontSize=10,
@@ -470,44 +596,172 @@ def create_pdf_report(patient_info, analysis_result):
             alignment=TA_JUSTIFY,
             leading=12,
             textColor=colors.HexColor('#666666')
-        )
-        
-        story.append(Paragraph("<b>MEDICAL DISCLAIMER</b>", heading_style))
-        story.append(Paragraph(
-            "This AI-generated analysis is for informational and educational purposes only and should not replace professional medical consultation. "
-            "The recommendations provided are based on general medical knowledge and should be reviewed with qualified healthcare professionals "
-            "before implementation. Always consult with your doctor, specialist, or certified healthcare provider for proper diagnosis, treatment, "
-            "and personalized medical advice. In case of medical emergencies, seek immediate professional medical attention.",
-            disclaimer_style
-        ))
-        
-        # Footer
-        story.append(Spacer(1, 20))
-        footer_style = ParagraphStyle(
+        ),
+        'footer': ParagraphStyle(
             'Footer',
             parent=styles['Normal'],
             fontSize=9,
             alignment=TA_CENTER,
             textColor=colors.HexColor('#888888')
-        )
-        story.append(Paragraph(f"Report generated by Medical Scan Analyzer | {current_date}", footer_style))
-        
-        # Build PDF
-        doc.build(story)
-        pdf_data = buffer.getvalue()
-        buffer.close()
-        return pdf_data
-        
-    except Exception as e:
-        st.error(f"Error creating PDF report: {e}")
-        return None
+        ),
+        'patient_table': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#E8F4FD')),
+            ('BACKGROUND', (0, 7), (-1, 7), colors.HexColor('#E8F4FD')),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.HexColor('#2E5E8A')),
+            ('TEXTCOLOR', (0, 7), (-1, 7), colors.HexColor('#2E5E8A')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 7), (-1, 7), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#CCCCCC')),
+            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+        ]),
+    }
+
+def create_pdf_report(patient_info, analysis_result, report_date):
+    """Create a formal PDF report, returned as a rewound buffer; errors propagate to the caller."""
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table
+    
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=A4, rightMargin=72, leftMargin=72, topMargin=72, bottomMargin=72)
+    
+    # Shared, process-wide style objects
+    pdf_styles = get_pdf_styles()
+    title_style = pdf_styles['title']
+    heading_style = pdf_styles['heading']
+    body_style = pdf_styles['body']
+    
+    # Build the PDF content
+    story = []
+    
+    # Title
+    story.append(Paragraph("COMPREHENSIVE MEDICAL SCAN ANALYSIS REPORT", title_style))
+    story.append(Spacer(1, 12))
+    
+    # Report Information
+    story.append(Paragraph(f"<b>Report Generated:</b> {report_date}", body_style))
+    story.append(Spacer(1, 20))
+    
+    # Patient Information Table
+    profile = summarize_patient_profile(patient_info)
+    
+    patient_data = [
+        ['Patient Demographics', ''],
+        ['Age', f"{patient_info['age']} years"],
+        ['Gender', patient_info['gender']],
+        ['Height', f"{patient_info['height']} cm"],
+        ['Weight', f"{patient_info['weight']} kg"],
+        ['BMI', f"{profile['bmi']:.1f} ({profile['bmi_category']})"],
+        ['', ''],
+        ['Health Information', ''],
+        ['Existing Conditions', profile['conditions']],
+        ['Current Medications', patient_info.get('medications', 'None reported')],
+        ['Known Allergies', patient_info.get('allergies', 'None reported')],
+        ['Exercise Frequency', patient_info.get('exercise_freq', 'Not specified')],
+        ['Sleep Hours per Night', f"{patient_info.get('sleep_hours', 'Not specified')}"],
+        ['Stress Level', patient_info.get('stress_level', 'Not specified')],
+        ['Smoking Status', patient_info.get('smoking', 'Not specified')],
+        ['Alcohol Consumption', patient_info.get('alcohol', 'Not specified')],
+        ['Diet Type', patient_info.get('diet_type', 'Not specified')],
+        ['Current Pain Level', f"{patient_info.get('pain_level', 0)}/10"],
+        ['Current Symptoms', profile['symptoms']]
+    ]
+    
+    table = Table(patient_data, colWidths=[2.5*inch, 3.5*inch])
+    table.setStyle(pdf_styles['patient_table'])
+    
+    story.append(table)
+    story.append(Spacer(1, 20))
+    
+    # Additional Concerns Section
+    if patient_info.get('additional_concerns', '').strip():
+        story.append(Paragraph("Additional Concerns", heading_style))
+        story.append(Paragraph(html_escape(patient_info['additional_concerns'], quote=False), body_style))
+        story.append(Spacer(1, 12))
+    
+    # Analysis Results
+    story.append(Paragraph("COMPREHENSIVE ANALYSIS & RECOMMENDATIONS", heading_style))
+    story.append(Spacer(1, 12))
+    
+    # Split analysis into paragraphs for better formatting
+    analysis_paragraphs = analysis_result.split('\n\n')
+    for paragraph in analysis_paragraphs:
+        lines = [line.strip() for line in paragraph.splitlines() if line.strip()]
+        if lines:
+            # Keep line breaks inside one Paragraph, render list markers as bullets, drop
+            # remaining markup and escape characters ReportLab would parse as tags
+            clean_paragraph = "<br/>".join(
+                ("• " + line[2:] if line.startswith(("- ", "* ")) else line).translate(PDF_TEXT_TRANSLATION)
+                for line in lines
+            )
+            story.append(Paragraph(clean_paragraph, pdf_styles['analysis']))
+    
+    # Disclaimer
+    story.append(Spacer(1, 20))
+    story.append(Paragraph("<b>MEDICAL DISCLAIMER</b>", heading_style))
+    story.append(Paragraph(
+        f"{load_static_text('disclaimer.md')} {load_static_text('emergency.md')}",
+        pdf_styles['disclaimer']
+    ))
+    
+    # Footer
+    story.append(Spacer(1, 20))
+    story.append(Paragraph(f"Report generated by Medical Scan Analyzer | {report_date}", pdf_styles['footer']))
+    
+    # Build PDF and hand back the buffer itself instead of copying it into bytes
+    doc.build(story)
+    buffer.seek(0)
+    return buffer
+
+def remove_stale_uploads():
+    """Delete temp uploads older than STALE_UPLOAD_SECONDS, including those of sessions that have closed."""
+    cutoff = time.time() - STALE_UPLOAD_SECONDS
+    for stale_path in Path(gettempdir()).glob(f"{UPLOAD_TEMP_PREFIX}*"):
+        try:
+            if stale_path.stat().st_mtime < cutoff:
+                stale_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+@st.cache_resource
+def cleanup_stale_uploads():
+    """Sweep uploads left behind by earlier processes once at startup."""
+    remove_stale_uploads()
 
 def save_uploaded_file(uploaded_file):
-    """Save the uploaded file to disk."""
+    """Save the uploaded file to disk once per upload, streaming it in chunks rather than copying it whole.
+    
+    The path is remembered in session state, so re-analyzing the same upload reuses the file;
+    temp files from the session's earlier uploads are removed when a new one is saved, and
+    every save also sweeps stale uploads left by sessions that have since closed.
+    """
+    upload_paths = st.session_state.setdefault('upload_paths', {})
+    
+    cached_path = upload_paths.get(uploaded_file.file_id)
+    if cached_path:
+        # Refresh the mtime before sweeping, so stale-upload sweeps treat the file as in use
+        try:
+            os.utime(cached_path)
+        except OSError:
+            cached_path = None  # Already swept; save the upload again below
+    
+    remove_stale_uploads()
+    if cached_path:
+        return cached_path
+    
+    for stale_path in upload_paths.values():
+        Path(stale_path).unlink(missing_ok=True)
+    upload_paths.clear()
+    
     try:
-        with NamedTemporaryFile(delete=False, suffix=f"_{uploaded_file.name}") as temp_file:
-            temp_file.write(uploaded_file.getvalue())
+        with NamedTemporaryFile(delete=False, prefix=UPLOAD_TEMP_PREFIX, suffix=f"_{uploaded_file.name}") as temp_file:
+            uploaded_file.seek(0)
+            shutil.copyfileobj(uploaded_file, temp_file, length=UPLOAD_CHUNK_SIZE)
             temp_path = temp_file.name
+        upload_paths[uploaded_file.file_id] = temp_path
         return temp_path
     except Exception as e:
         st.error(f"Error saving uploaded file: {e}")
@@ -522,78 +776,19 @@ def main():
         page_icon="🩺"
     )
     
-    # Custom CSS for light nude theme and better UX
-    st.markdown("""
-    <style>
-        .main {
-            background-color: #faf8f6;
-        }
-        .stApp {
-            background-color: #faf8f6;
-        }
-        .stButton>button {
-            background-color: #e8d5c7;
-            color: #5d4037;
-            border: none;
-            border-radius: 8px;
-            padding: 0.5rem 1rem;
-            font-weight: 500;
-            transition: all 0.3s ease;
-        }
-        .stButton>button:hover {
-            background-color: #d7c4b7;
-            transform: translateY(-2px);
-        }
-        .stSelectbox>div>div {
-            background-color: #f5f1ed;
-        }
-        .stTextArea>div>div>textarea {
-            background-color: #f5f1ed;
-        }
-        .stNumberInput>div>div>input {
-            background-color: #f5f1ed;
-        }
-        .stTextInput>div>div>input {
-            background-color: #f5f1ed;
-        }
-        .stMultiSelect>div>div {
-            background-color: #f5f1ed;
-        }
-        .stSlider>div>div>div>div {
-            background-color: #e8d5c7;
-        }
-        h1, h2, h3 {
-            color: #5d4037;
-        }
-        .main-title {
-            text-align: center;
-            font-weight: bold;
-            color: #5d4037;
-            font-size: 2.5rem;
-            margin-bottom: 1rem;
-        }
-        .subtitle {
-            text-align: center;
-            color: #5d4037;
-            font-size: 1.2rem;
-            margin-bottom: 2rem;
-        }
-        .analysis-result {
-            background-color: #f5f1ed;
-            padding: 1.5rem;
-            border-radius: 10px;
-            border-left: 4px solid #e8d5c7;
-            margin: 1rem 0;
-        }
-        .step-container {
-            background-color: #f5f1ed;
-            padding: 2rem;
-            border-radius: 15px;
-            margin: 1rem 0;
-            border: 1px solid #e8d5c7;
-        }
-    </style>
-    """, unsafe_allow_html=True)
+    # Warm up heavy libraries in the background while the page renders
+    start_prewarm()
+    cleanup_stale_uploads()
+    cleanup_analysis_cache()
+    
+    # Periodically reclaim buffers left behind by earlier reruns of this session
+    st.session_state.rerun_count = st.session_state.get('rerun_count', 0) + 1
+    if st.session_state.rerun_count % GC_EVERY_N_RERUNS == 0:
+        gc.collect()
+    
+    # Custom CSS for light nude theme and better UX. Streamlit drops elements that a
+    # rerun does not emit again, so the style tag has to be sent on every rerun.
+    st.markdown(f"<style>{load_static_text('style.css')}</style>", unsafe_allow_html=True)
     
     # Header
     st.markdown('<h1 class="main-title">🩺 Enhanced Medical Scan Analyzer</h1>', unsafe_allow_html=True)
@@ -603,14 +798,22 @@ def main():
     st.subheader("📁 Upload Medical Scan Report")
     uploaded_file = st.file_uploader(
         "Upload medical scan report (X-ray, MRI, CT scan, blood report, etc.)",
-        type=["jpg", "jpeg", "png", "pdf"],
+        type=UPLOAD_FILE_TYPES,
         help="Upload a clear image of your medical scan report for analysis"
     )
     
+    # Reject empty or oversized files before any decoding or model work; .size needs no read
+    if uploaded_file and not MIN_SCAN_BYTES <= uploaded_file.size <= MAX_SCAN_BYTES:
+        st.error(
+            f"The uploaded file must be between {MIN_SCAN_BYTES // 1024} KB and "
+            f"{MAX_SCAN_BYTES // (1024 * 1024)} MB. Please upload a different scan."
+        )
+        uploaded_file = None
+    
     if uploaded_file:
         # Display uploaded image
         if uploaded_file.type != "application/pdf":
-            resized_image = resize_image_for_display(uploaded_file)
+            resized_image = resize_image_for_display(uploaded_file.file_id, uploaded_file)
             if resized_image:
                 col1, col2, col3 = st.columns([1, 2, 1])
                 with col2:
@@ -619,14 +822,11 @@ def main():
             st.success("📄 PDF file uploaded successfully")
     
     # Patient information collection with improved UX
-    st.markdown("---")
-    st.subheader("📋 Patient Assessment")
+    st.markdown("---\n### 📋 Patient Assessment")
     
-    # Create a container for better styling
-    with st.container():
-        st.markdown('<div class="step-container">', unsafe_allow_html=True)
+    # Bordered container around the step form
+    with st.container(border=True):
         patient_info = collect_patient_information()
-        st.markdown('</div>', unsafe_allow_html=True)
     
     # Analysis section - only show if both file and patient info are ready
     if uploaded_file and patient_info:
@@ -634,12 +834,12 @@ def main():
         
         # Show summary of collected information
         with st.expander("📊 Assessment Summary", expanded=False):
-            bmi = patient_info['weight'] / ((patient_info['height'] / 100) ** 2)
+            profile = summarize_patient_profile(patient_info)
             col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.metric("Age", f"{patient_info['age']} years")
-                st.metric("BMI", f"{bmi:.1f}")
+                st.metric("BMI", f"{profile['bmi']:.1f}")
             
             with col2:
                 st.metric("Exercise", patient_info.get('exercise_freq', 'Not specified'))
@@ -653,39 +853,41 @@ def main():
         if st.button("🔬 Analyze Medical Scan & Generate Report", type="primary", use_container_width=True):
             temp_path = save_uploaded_file(uploaded_file)
             if temp_path:
-                st.markdown("---")
-                st.subheader("📊 Analysis Results & Personalized Recommendations")
-                
                 analysis_result = analyze_medical_scan(temp_path, patient_info)
                 
-                if analysis_result:
+                # Skip the results and download section entirely when the analysis came back empty
+                if analysis_result and analysis_result.strip():
+                    st.markdown("---\n### 📊 Analysis Results & Personalized Recommendations")
+                    
                     # Display analysis in a styled container
                     st.markdown(f'<div class="analysis-result">{analysis_result}</div>', unsafe_allow_html=True)
                     
                     # Create PDF and provide download
                     with st.spinner("📄 Generating PDF report..."):
-                        pdf_data = create_pdf_report(patient_info, analysis_result)
+                        generated_at = datetime.datetime.now()
+                        try:
+                            pdf_data = create_pdf_report(
+                                patient_info, analysis_result, generated_at.strftime(REPORT_DATE_FORMAT)
+                            )
+                        except Exception as e:
+                            st.error(f"Error creating PDF report: {e}")
+                            pdf_data = None
                         
                         if pdf_data:
-                            current_date = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                            
                             st.success("✅ Report generated successfully!")
                             st.download_button(
                                 label="📥 Download PDF Report",
                                 data=pdf_data,
-                                file_name=f"Medical_Analysis_Report_{current_date}.pdf",
+                                file_name=PDF_FILENAME_TEMPLATE.format(generated_at),
                                 mime="application/pdf",
                                 help="Download the complete analysis report as a professional PDF document",
                                 use_container_width=True
                             )
+                            # The button has serialized the PDF; drop our reference to the buffer
+                            pdf_data.close()
+                            del pdf_data
                         else:
                             st.error("Failed to generate PDF report. Please try again.")
-                
-                # Clean up temporary file
-                try:
-                    os.unlink(temp_path)
-                except:
-                    pass
     
     # Show appropriate messages based on current state
     elif not uploaded_file and not patient_info:
@@ -697,17 +899,10 @@ def main():
     
     # Enhanced Disclaimer
     st.markdown("---")
-    st.markdown("""
-    **⚠️ Important Medical Disclaimer:**
-    
-    This AI analysis is for informational and educational purposes only and should not replace professional medical consultation. 
-    The recommendations provided are based on general medical knowledge and should be reviewed with qualified healthcare professionals 
-    before implementation. Always consult with your doctor, specialist, or certified nutritionist for proper diagnosis, treatment, 
-    and personalized dietary/lifestyle advice.
-    
-    **🚨 Emergency Situations:** If you experience severe symptoms, chest pain, difficulty breathing, or any medical emergency, 
-    seek immediate medical attention by calling emergency services or visiting the nearest emergency room.
-    """)
+    st.markdown(
+        f"**⚠️ Important Medical Disclaimer:**\n\n{load_static_text('disclaimer.md')}\n\n"
+        f"**🚨 Emergency Situations:** {load_static_text('emergency.md')}"
+    )
 
 if __name__ == "__main__":
     main()